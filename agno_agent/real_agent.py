@@ -6,14 +6,26 @@ An intelligent agent that connects to the actual Simple Task MCP server to analy
 real tasks from aitistra.com, reason about priorities, and provide actionable recommendations.
 """
 
+import argparse
+import asyncio
+import inspect
+import io
+import json
 import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 from textwrap import dedent
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
 from agno.agent import Agent
+from agno.run.agent import RunOutput
 from agno.models.openai import OpenAIChat
+from openai import OpenAI
 from real_mcp_tools import (
     get_simple_task_overview, 
     get_blocked_tasks, 
@@ -21,9 +33,14 @@ from real_mcp_tools import (
     analyze_team_workload,
     search_tasks,
     get_project_info,
-    switch_project
 )
 
+# orjson is optional; fall back to the standard library parser
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load environment variables from .env file
 try:
     from dotenv import load_dotenv
@@ -36,11 +53,118 @@ except ImportError:
 except Exception as e:
     print(f"⚠️  Could not load .env file: {e}")
 
+# Latency-optimized default; override with OPENAI_MODEL (e.g. gpt-4o)
+DEFAULT_MODEL_ID = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+
+# Background workers that warm the tool cache while the model starts generating
+_PREFETCH_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="tool-prefetch")
+
+# Agent instances keyed by (model_id, project_name, debug)
+_AGENT_CACHE: Dict[tuple, "RealSimpleTaskAgent"] = {}
+_CACHE_LOCK = threading.Lock()
+_CACHE_STATS = {"hits": 0, "misses": 0, "total_init_ms": 0.0}
+
+
+# Static agent prompt blocks, built once at import and shared by every agent
+_DESCRIPTION = dedent("""\
+    You are TaskMaster AI Live, an advanced project management assistant with direct access 
+    to live Simple Task data from aitistra.com. You analyze real-time project data to identify 
+    patterns, bottlenecks, and provide strategic recommendations based on actual team workloads.
+    
+    Your live data capabilities include:
+    - Real-time access to task statuses, priorities, and assignments
+    - Live team workload analysis and capacity assessment  
+    - Current blocker identification with actual impact analysis
+    - Strategic prioritization based on real project constraints
+    - Risk assessment using actual project data patterns
+    - Resource optimization recommendations from live metrics
+    
+    Your analytical approach with live data:
+    - Always start by gathering current live data using available tools
+    - Identify actual patterns and trends from real task distributions
+    - Focus on genuine blockers that are currently impacting project flow
+    - Provide data-driven recommendations based on real team capacity
+    - Account for actual deadlines and dependencies from live project data
+    - Recommend specific actions that team members can take immediately\
+""")
+
+_INSTRUCTIONS = dedent("""\
+    Follow this systematic approach for live task analysis:
+    
+    1. **Live Data Gathering**: Use available tools to collect real-time task information
+       - Get current task overview to understand actual project status
+       - Identify real blocked tasks that need immediate attention  
+       - Analyze actual high-priority tasks and their current progress
+       - Assess real team workload distribution and capacity constraints
+    
+    2. **Real Pattern Analysis**: Look for genuine insights in the live data
+       - Identify actual bottlenecks currently blocking project progress
+       - Analyze real workload distribution and team capacity issues
+       - Assess actual priority alignment with current business needs
+       - Examine real dependencies that create current risks or delays
+    
+    3. **Current Situation Assessment**: Evaluate immediate tactical needs
+       - Prioritize actual tasks that can be completed now
+       - Identify real resource allocation inefficiencies  
+       - Assess genuine risk factors from current project state
+       - Evaluate actual project health indicators and trends
+    
+    4. **Actionable Live Recommendations**: Provide specific, immediate actions
+       - Clear next steps based on current task states
+       - Real timeline expectations from actual project data
+       - Specific resource requirements based on current team capacity
+       - Immediate follow-up actions team members can take today
+    
+    Always ground your analysis in the actual live data from the tools, and provide specific 
+    task IDs, team member names, and current statuses when making recommendations.\
+""")
+
+_EXPECTED_OUTPUT = (
+    "Markdown report titled 'TaskMaster AI Live Analysis' with sections: Current Project Status; "
+    "Immediate Blockers; Real Performance Patterns; Team Capacity; Critical Actions (next 24h); "
+    "This Week; Strategic (next sprint); Risk Factors; Mitigation; Success Tracking; Next Review. "
+    "Cite task IDs and team members. End with 'Data Source: Live aitistra.com API via MCP Server'."
+)
+
+
+@lru_cache(maxsize=1)
+def _shared_openai_client() -> OpenAI:
+    """OpenAI client shared by every agent's model.
+    
+    Agno registers each agent's tools on its model instance, so model objects
+    cannot be shared between agents bound to different projects; sharing the
+    client still gives them one HTTP connection pool and TLS session cache.
+    """
+    return OpenAI()
+
+
+def _bind_project(func: Callable[..., str], project_name: Optional[str]) -> Callable[..., str]:
+    """Bind project_name into an MCP tool function.
+    
+    Returns a plain function carrying the tool's docstring and signature (minus
+    project_name), so Agno derives the same description and schema as for the
+    unbound tool. A functools.partial would not do: Agno describes a partial by
+    its repr, which includes a per-process memory address.
+    """
+    def tool(*args, **kwargs):
+        return func(*args, project_name=project_name, **kwargs)
+    
+    signature = inspect.signature(func)
+    tool.__signature__ = signature.replace(
+        parameters=[p for name, p in signature.parameters.items() if name != "project_name"]
+    )
+    tool.__annotations__ = {k: v for k, v in func.__annotations__.items() if k != "project_name"}
+    tool.__name__ = f"{func.__name__}_for_project"
+    tool.__qualname__ = tool.__name__
+    tool.__doc__ = func.__doc__
+    tool.__module__ = func.__module__
+    return tool
+
 
 class RealSimpleTaskAgent:
     """Real Agno agent with live MCP integration for Simple Task management."""
     
-    def __init__(self, model_id: str = "gpt-4o", debug: bool = False, project_name: str = None):
+    def __init__(self, model_id: str = DEFAULT_MODEL_ID, debug: bool = False, project_name: str = None):
         """Initialize the real Simple Task agent.
         
         Args:
@@ -49,137 +173,49 @@ class RealSimpleTaskAgent:
             project_name: Specific project to analyze (None for default)
         """
         self.project_name = project_name
+        self.debug = debug
         
-        # Create project-specific tool functions
-        def get_simple_task_overview_for_project() -> str:
-            return get_simple_task_overview(project_name)
-            
-        def get_blocked_tasks_for_project() -> str:
-            return get_blocked_tasks(project_name)
-            
-        def get_high_priority_tasks_for_project() -> str:
-            return get_high_priority_tasks(project_name)
-            
-        def analyze_team_workload_for_project() -> str:
-            return analyze_team_workload(project_name)
-            
-        def search_tasks_for_project(query: str) -> str:
-            return search_tasks(query, project_name)
-            
-        def get_project_info_for_project() -> str:
-            return get_project_info(project_name)
+        # Only wire up Agno's debug logging when it is actually wanted
+        agent_kwargs = {"debug_mode": True} if debug else {}
         
         self.agent = Agent(
-            model=OpenAIChat(id=model_id),
-            tools=[
-                get_simple_task_overview_for_project,
-                get_blocked_tasks_for_project, 
-                get_high_priority_tasks_for_project,
-                analyze_team_workload_for_project,
-                search_tasks_for_project,
-                get_project_info_for_project
-            ],
-            description=dedent("""\
-                You are TaskMaster AI Live, an advanced project management assistant with direct access 
-                to live Simple Task data from aitistra.com. You analyze real-time project data to identify 
-                patterns, bottlenecks, and provide strategic recommendations based on actual team workloads.
-                
-                Your live data capabilities include:
-                - Real-time access to task statuses, priorities, and assignments
-                - Live team workload analysis and capacity assessment  
-                - Current blocker identification with actual impact analysis
-                - Strategic prioritization based on real project constraints
-                - Risk assessment using actual project data patterns
-                - Resource optimization recommendations from live metrics
-                
-                Your analytical approach with live data:
-                - Always start by gathering current live data using available tools
-                - Identify actual patterns and trends from real task distributions
-                - Focus on genuine blockers that are currently impacting project flow
-                - Provide data-driven recommendations based on real team capacity
-                - Account for actual deadlines and dependencies from live project data
-                - Recommend specific actions that team members can take immediately\
-            """),
-            instructions=dedent("""\
-                Follow this systematic approach for live task analysis:
-                
-                1. **Live Data Gathering**: Use available tools to collect real-time task information
-                   - Get current task overview to understand actual project status
-                   - Identify real blocked tasks that need immediate attention  
-                   - Analyze actual high-priority tasks and their current progress
-                   - Assess real team workload distribution and capacity constraints
-                
-                2. **Real Pattern Analysis**: Look for genuine insights in the live data
-                   - Identify actual bottlenecks currently blocking project progress
-                   - Analyze real workload distribution and team capacity issues
-                   - Assess actual priority alignment with current business needs
-                   - Examine real dependencies that create current risks or delays
-                
-                3. **Current Situation Assessment**: Evaluate immediate tactical needs
-                   - Prioritize actual tasks that can be completed now
-                   - Identify real resource allocation inefficiencies  
-                   - Assess genuine risk factors from current project state
-                   - Evaluate actual project health indicators and trends
-                
-                4. **Actionable Live Recommendations**: Provide specific, immediate actions
-                   - Clear next steps based on current task states
-                   - Real timeline expectations from actual project data
-                   - Specific resource requirements based on current team capacity
-                   - Immediate follow-up actions team members can take today
-                
-                Always ground your analysis in the actual live data from the tools, and provide specific 
-                task IDs, team member names, and current statuses when making recommendations.\
-            """),
-            expected_output=dedent("""\
-                # TaskMaster AI Live Analysis
-                
-                ## Current Project Status
-                {Data-driven assessment of actual task states and team capacity}
-                
-                ## Live Insights
-                ### 🚨 Immediate Blockers (Action Required Now)
-                {Current blocked tasks with specific task IDs and team members}
-                
-                ### 📊 Real Performance Patterns  
-                {Actual trends identified from live project data}
-                
-                ### ⚖️ Current Team Capacity
-                {Live workload analysis showing actual team utilization}
-                
-                ## Priority Actions Based on Live Data
-                
-                ### 🔥 Critical Actions (Next 24 Hours)
-                1. **[Task ID]**: {Specific action} - {Team member} should {specific step}
-                2. **[Task ID]**: {Specific action} - {Team member} should {specific step}
-                
-                ### 🎯 This Week's Focus 
-                1. **{Specific initiative}** - Based on {actual data point from analysis}
-                2. **{Specific initiative}** - Based on {actual data point from analysis}
-                
-                ### 🚀 Strategic Priorities (Next Sprint)
-                1. **{Initiative}** - {Reasoning from actual project patterns}
-                2. **{Initiative}** - {Reasoning from actual project patterns}
-                
-                ## Live Risk Assessment
-                ### ⚠️ Current Risk Factors
-                - **{Specific risk from data}**: {Current impact and likelihood}
-                
-                ### 🛡️ Immediate Mitigation Actions
-                - **{Action}**: {Who should do what by when}
-                
-                ## Success Tracking
-                - {Specific measurable outcome from current data}
-                - {Specific measurable outcome from current data}
-                
-                ## Next Review Checkpoint
-                **Recommended follow-up**: {Specific timeline and focus areas}
-                
-                ---
-                Analysis by TaskMaster AI Live • {current_datetime}
-                Data Source: Live aitistra.com API via MCP Server\
-            """),
+            model=OpenAIChat(
+                id=model_id,
+                service_tier=os.getenv("OPENAI_SERVICE_TIER") or None,
+                client=_shared_openai_client(),
+            ),
+            tools=list(self._tools_for(project_name)),
+            description=_DESCRIPTION,
+            instructions=_INSTRUCTIONS,
+            expected_output=_EXPECTED_OUTPUT,
             markdown=True,
-            debug_mode=debug,
+            **agent_kwargs,
+        )
+        # description/instructions/expected_output form a static system prefix. OpenAI
+        # caches identical prompt prefixes automatically, so keep it free of per-call data
+        # (timestamps, project names) and put everything variable in the user prompt.
+    
+    @classmethod
+    @lru_cache(maxsize=32)
+    def _tools_for(cls, project_name: Optional[str]) -> Tuple[Callable[..., str], ...]:
+        """Build the project-bound tool functions, memoized per project.
+        
+        Args:
+            project_name: Project the tools are bound to (None for default)
+            
+        Returns:
+            Tuple of tool callables shared by every agent for that project
+        """
+        return tuple(
+            _bind_project(tool, project_name)
+            for tool in (
+                get_simple_task_overview,
+                get_blocked_tasks,
+                get_high_priority_tasks,
+                analyze_team_workload,
+                search_tasks,
+                get_project_info,
+            )
         )
     
     def analyze_live_project_health(self, project_name: str = None) -> str:
@@ -191,12 +227,15 @@ class RealSimpleTaskAgent:
         Returns:
             Detailed project health assessment based on live data
         """
+        # This analysis always needs these tools; fetch them while the model prefills
+        self._prefetch(get_simple_task_overview, get_blocked_tasks, get_high_priority_tasks, analyze_team_workload)
+        
         prompt = "Analyze the current live project health by examining real task distribution, actual blocked items, current high-priority work, and live team workloads. Provide specific recommendations with task IDs and team member names for improving project flow and addressing real bottlenecks."
         
         if project_name:
             prompt += f" Focus specifically on the '{project_name}' project."
         
-        return self.agent.run(prompt).content
+        return self._run_streamed(prompt)
     
     def daily_standup_briefing_live(self, project_name: str = None) -> str:
         """Generate a daily standup briefing with actual current priorities.
@@ -212,7 +251,7 @@ class RealSimpleTaskAgent:
         if project_name:
             prompt += f" Focus on the '{project_name}' project."
             
-        return self.agent.run(prompt).content
+        return self._run_streamed(prompt)
     
     def identify_live_optimization_opportunities(self, project_name: str = None) -> str:
         """Identify opportunities for optimization based on live data.
@@ -228,7 +267,7 @@ class RealSimpleTaskAgent:
         if project_name:
             prompt += f" Focus on the '{project_name}' project."
             
-        return self.agent.run(prompt).content
+        return self._run_streamed(prompt)
     
     def live_risk_assessment(self, project_name: str = None) -> str:
         """Perform risk assessment based on actual current task status.
@@ -244,7 +283,7 @@ class RealSimpleTaskAgent:
         if project_name:
             prompt += f" Focus on risks specific to the '{project_name}' project."
             
-        return self.agent.run(prompt).content
+        return self._run_streamed(prompt)
     
     def search_and_prioritize(self, search_terms: str, project_name: str = None) -> str:
         """Search for tasks and provide prioritization recommendations.
@@ -261,25 +300,182 @@ class RealSimpleTaskAgent:
         if project_name:
             prompt += f" Focus the search on the '{project_name}' project."
             
-        return self.agent.run(prompt).content
+        return self._run_streamed(prompt)
+    
+    def _prefetch(self, *tools: Callable[..., str]) -> None:
+        """Start tool calls in the background so their results are cached when the model asks.
+        
+        Tools are called exactly as the agent's bound tools call them, so they share
+        cache entries; a tool call made while a prefetch is in flight waits for it.
+        """
+        for tool in tools:
+            _PREFETCH_EXECUTOR.submit(tool, project_name=self.project_name)
+    
+    def _run_streamed(self, prompt: str) -> str:
+        """Run a prompt against the agent and return the response content.
+        
+        The response is streamed and accumulated chunk by chunk, so the full text
+        is only materialized once.
+        """
+        buffer = io.StringIO()
+        self._stream(prompt, buffer.write)
+        return buffer.getvalue()
+    
+    def _stream(self, prompt: str, write: Callable[[str], Any]) -> None:
+        """Stream a prompt's response content to ``write``.
+        
+        In debug mode the number of prompt tokens served from the provider's
+        prefix cache is logged afterwards, so cache hits on the static prefix
+        can be checked.
+        """
+        run_output = None
+        for chunk in self.agent.run(prompt, stream=True, yield_run_output=True):
+            if isinstance(chunk, RunOutput):
+                run_output = chunk  # Final output; its content was already streamed
+            elif isinstance(chunk.content, str):
+                write(chunk.content)
+        
+        if self.debug:
+            cached_tokens = getattr(getattr(run_output, "metrics", None), "cache_read_tokens", 0)
+            print(f"🗄️  Cached prompt tokens: {cached_tokens or 0}")
+    
+    async def _arun(self, prompt: str) -> str:
+        """Run a prompt asynchronously and return the response content."""
+        response = await self.agent.arun(prompt)
+        return response.content
     
     def print_analysis(self, prompt: str) -> None:
-        """Print analysis results with streaming output."""
+        """Print analysis results with streaming output.
+        
+        In debug mode the raw markdown is streamed to stdout instead of Agno's
+        formatted panel, so the cached prompt token count can be logged too.
+        """
+        if self.debug:
+            self._stream(prompt, sys.stdout.write)
+            sys.stdout.write("\n")
+            return
         self.agent.print_response(prompt, stream=True)
 
 
+def get_agent(model_id: str = DEFAULT_MODEL_ID, debug: bool = False, project_name: str = None) -> RealSimpleTaskAgent:
+    """Get a cached agent for the given configuration, creating it on first use.
+    
+    Args:
+        model_id: OpenAI model to use
+        debug: Enable debug mode for detailed logging
+        project_name: Specific project to analyze (None for default)
+        
+    Returns:
+        Shared RealSimpleTaskAgent instance
+    """
+    key = (model_id, project_name, debug)
+    with _CACHE_LOCK:
+        agent = _AGENT_CACHE.get(key)
+        if agent is not None:
+            _CACHE_STATS["hits"] += 1
+            return agent
+        
+        start = time.perf_counter()
+        agent = RealSimpleTaskAgent(model_id=model_id, debug=debug, project_name=project_name)
+        _CACHE_STATS["total_init_ms"] += (time.perf_counter() - start) * 1000
+        _CACHE_STATS["misses"] += 1
+        _AGENT_CACHE[key] = agent
+        return agent
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    """Get agent cache statistics.
+    
+    Returns:
+        Dictionary with hits, misses, cached agent count and average init time in ms
+    """
+    with _CACHE_LOCK:
+        misses = _CACHE_STATS["misses"]
+        return {
+            "hits": _CACHE_STATS["hits"],
+            "misses": misses,
+            "size": len(_AGENT_CACHE),
+            "avg_init_ms": _CACHE_STATS["total_init_ms"] / misses if misses else 0.0,
+        }
+
+
+def build_briefing_prompts(project_name: str = None) -> List[tuple]:
+    """Build the individual health analysis, standup briefing and risk assessment prompts.
+    
+    Args:
+        project_name: Specific project to focus on (None for default)
+        
+    Returns:
+        List of (section title, prompt) pairs in display order
+    """
+    health = "Perform a comprehensive live project health analysis using real data"
+    standup = "Generate a daily standup briefing with current priorities using live task data"
+    risk = "Perform a risk assessment using actual current project data and suggest specific mitigation strategies"
+    if project_name:
+        health += f" focusing specifically on the '{project_name}' project"
+        standup += f" for the '{project_name}' project"
+        risk += f" focusing on the '{project_name}' project"
+    
+    return [
+        ("📊 LIVE PROJECT HEALTH ANALYSIS", health),
+        ("☀️ DAILY STANDUP BRIEFING (LIVE DATA)", standup),
+        ("⚠️ LIVE RISK ASSESSMENT", risk),
+    ]
+
+
+async def _drive(agent: RealSimpleTaskAgent, prompts: List[str]) -> List[str]:
+    """Run independent prompts concurrently, returning results in prompt order."""
+    return await asyncio.gather(*[agent._arun(prompt) for prompt in prompts])
+
+
+def build_combined_briefing_prompt(project_name: str = None) -> str:
+    """Build a single prompt covering health analysis, standup briefing and risk assessment.
+    
+    The three sections stand in for the agent's full report outline, which the
+    prompt says explicitly, so the model does not nest three complete reports.
+    The outline itself stays in the static system prefix so it remains cacheable.
+    
+    Args:
+        project_name: Specific project to focus on (None for default)
+        
+    Returns:
+        Composite prompt asking for all three sections in one response
+    """
+    focus = f" focusing specifically on the '{project_name}' project" if project_name else ""
+    return dedent(f"""\
+        Using live task data{focus}, produce all three of the following sections in a single response.
+        Gather the live data once and reuse it across the sections.
+        
+        ## 1. Health Analysis
+        Perform a comprehensive live project health analysis using real data.
+        
+        ## 2. Standup
+        Generate a daily standup briefing with current priorities using live task data.
+        
+        ## 3. Risk
+        Perform a risk assessment using actual current project data and suggest specific mitigation strategies.
+        
+        This response replaces the usual single-report outline: use exactly these three headers, in this order,
+        with no other top-level sections. Cite task IDs and team members, and end with
+        'Data Source: Live aitistra.com API via MCP Server'.""")
+
+
+@lru_cache(maxsize=8)
+def _load_projects_cached(path: str, mtime: float) -> List[Dict[str, Any]]:
+    """Load and parse projects.json; cached until the file's mtime changes."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
 def get_available_projects():
     """Get list of available projects from projects.json"""
-    import json
-    
     # Get the script directory and construct the projects.json path relative to it
     script_dir = os.path.dirname(os.path.abspath(__file__))
     projects_file = os.path.join(script_dir, "..", "mcp_server", "projects.json")
     
     try:
-        with open(projects_file, 'r') as f:
-            projects = json.load(f)
-        return projects
+        return _load_projects_cached(projects_file, os.path.getmtime(projects_file))
     except Exception as e:
         print(f"❌ Error reading projects.json: {e}")
         return []
@@ -296,14 +492,14 @@ def select_project():
     print("🎯 Available Projects:")
     print("=" * 50)
     
-    for i, project in enumerate(projects, 1):
-        name = project.get("name", "Unknown")
-        project_name = project.get("projectName", "unknown")
-        description = project.get("description", "No description")
-        print(f"{i}. {name}")
-        print(f"   Key: {project_name}")
-        print(f"   Description: {description}")
-        print()
+    # Build the listing once and write it in a single call
+    sys.stdout.write("".join(
+        f"{i}. {project.get('name', 'Unknown')}\n"
+        f"   Key: {project.get('projectName', 'unknown')}\n"
+        f"   Description: {project.get('description', 'No description')}\n\n"
+        for i, project in enumerate(projects, 1)
+    ))
+    sys.stdout.flush()
     
     while True:
         try:
@@ -327,13 +523,69 @@ def select_project():
             return None
 
 
-def main():
-    """Example usage of the Real Simple Task Agent with live data."""
-    print("🤖 TaskMaster AI Live - Real Simple Task Analysis Agent")
-    print("=" * 70)
+def analyze_all_projects(
+    projects: List[str] = None,
+    max_concurrent: int = 8,
+    interactive: bool = False,
+) -> Dict[str, str]:
+    """Run a live health analysis for several projects in parallel.
     
-    # Check if OpenAI API key is set
-    if not os.getenv("OPENAI_API_KEY"):
+    Each project gets its cached agent from get_agent(). The thread pool size
+    bounds the number of simultaneous OpenAI requests.
+    
+    Args:
+        projects: Project keys to analyze (defaults to every project in projects.json)
+        max_concurrent: Maximum number of analyses in flight at once
+        interactive: Whether the user may be prompted for a missing API key
+        
+    Returns:
+        Mapping of project key to analysis text (or an error message)
+        
+    Raises:
+        RuntimeError: If the environment check fails
+    """
+    ensure_environment(interactive=interactive)
+    
+    if projects is None:
+        projects = [p.get("projectName") for p in get_available_projects() if p.get("projectName")]
+    
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
+        futures = {
+            executor.submit(get_agent(project_name=project).analyze_live_project_health): project
+            for project in projects
+        }
+        for future in as_completed(futures):
+            project = futures[future]
+            try:
+                results[project] = future.result()
+            except Exception as e:
+                results[project] = f"❌ Error analyzing {project}: {str(e)}"
+    
+    # Report in the order the projects were given, not completion order
+    return {project: results[project] for project in projects}
+
+
+@lru_cache(maxsize=1)
+def ensure_environment(interactive: bool = True) -> Tuple[str, str]:
+    """Validate the OpenAI API key and MCP server path once per process.
+    
+    Prompts for the API key if it is not set and interactive is True. Failures
+    are not cached, so a later call re-checks the environment.
+    
+    Args:
+        interactive: Whether the user may be prompted for a missing API key
+        
+    Returns:
+        Tuple of (api_key, mcp_path)
+        
+    Raises:
+        RuntimeError: If no API key is provided or the MCP server is not found
+    """
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key and not interactive:
+        raise RuntimeError("❌ OPENAI_API_KEY is not set. Exiting.")
+    if not api_key:
         print("⚠️  OpenAI API Key Not Found!")
         print("=" * 50)
         print("To avoid setting the API key every time, you can:")
@@ -350,62 +602,94 @@ def main():
         print("   export OPENAI_API_KEY=\"your-key-here\"")
         print()
         api_key = input("Or enter your API key now: ").strip()
-        if api_key:
-            os.environ["OPENAI_API_KEY"] = api_key
-            print("✅ API key set for this session!")
-        else:
-            print("❌ No API key provided. Exiting.")
-            return
+        if not api_key:
+            raise RuntimeError("❌ No API key provided. Exiting.")
+        os.environ["OPENAI_API_KEY"] = api_key
+        print("✅ API key set for this session!")
     
     # Check if MCP server path is accessible
     mcp_path = os.getenv("MCP_SERVER_PATH", "/Users/barryvelasquez/projects/simple_task_mcp/mcp_server/build")
     if not os.path.exists(mcp_path):
         print(f"⚠️  Warning: MCP server not found at {mcp_path}")
         print("Please ensure the Simple Task MCP server is built and accessible.")
-        print("Run: cd ../mcp_server && npm run build")
+        raise RuntimeError("Run: cd ../mcp_server && npm run build")
+    
+    return api_key, mcp_path
+
+
+def main():
+    """Example usage of the Real Simple Task Agent with live data."""
+    parser = argparse.ArgumentParser(description="TaskMaster AI Live - Real Simple Task Analysis Agent")
+    parser.add_argument(
+        "--concurrent",
+        action="store_true",
+        help="Run the health, standup and risk analyses as parallel requests (no streaming)",
+    )
+    parser.add_argument(
+        "--project",
+        default=os.getenv("DEFAULT_PROJECT") or None,
+        help="Project key to analyze, skipping interactive selection (default: $DEFAULT_PROJECT)",
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Run a health analysis for every project in projects.json in parallel",
+    )
+    parser.add_argument(
+        "--non-interactive",
+        action="store_true",
+        help="Never prompt for input; use the default project unless --project is given",
+    )
+    args = parser.parse_args()
+    
+    print("🤖 TaskMaster AI Live - Real Simple Task Analysis Agent")
+    print("=" * 70)
+    
+    try:
+        ensure_environment(interactive=not args.non_interactive)
+    except RuntimeError as e:
+        print(str(e))
         return
     
-    # Let user select project
-    selected_project = select_project()
+    if args.all:
+        for project, analysis in analyze_all_projects(interactive=not args.non_interactive).items():
+            print(f"\n📊 LIVE PROJECT HEALTH ANALYSIS: {project}")
+            print("-" * 50)
+            print(analysis)
+        return
+    
+    # Let user select project unless one was given or prompting is disabled
+    if args.project or args.non_interactive:
+        selected_project = args.project
+    else:
+        selected_project = select_project()
     if selected_project is False:  # User cancelled
         return
     
     # Initialize the agent
-    agent = RealSimpleTaskAgent(debug=False, project_name=selected_project)
+    agent = get_agent(debug=False, project_name=selected_project)
     
     project_display = selected_project if selected_project else "All Projects (Default)"
     print(f"\\n🔍 Starting live analysis for: {project_display}")
     print(f"📡 Data source: aitistra.com API via MCP server\\n")
     
     try:
-        # Comprehensive live project health analysis
-        print("📊 LIVE PROJECT HEALTH ANALYSIS")
-        print("-" * 50)
-        prompt = "Perform a comprehensive live project health analysis using real data"
-        if selected_project:
-            prompt += f" focusing specifically on the '{selected_project}' project"
-        agent.print_analysis(prompt)
-        
-        print("\\n" + "=" * 70 + "\\n")
-        
-        # Daily standup briefing with real data
-        print("☀️ DAILY STANDUP BRIEFING (LIVE DATA)") 
-        print("-" * 50)
-        prompt = "Generate a daily standup briefing with current priorities using live task data"
-        if selected_project:
-            prompt += f" for the '{selected_project}' project"
-        agent.print_analysis(prompt)
-        
-        print("\\n" + "=" * 70 + "\\n")
-        
-        # Risk assessment based on actual data
-        print("⚠️ LIVE RISK ASSESSMENT")
-        print("-" * 50)
-        prompt = "Perform a risk assessment using actual current project data and suggest specific mitigation strategies"
-        if selected_project:
-            prompt += f" focusing on the '{selected_project}' project"
-        agent.print_analysis(prompt)
-        
+        if args.concurrent:
+            # Independent analyses run in parallel; wall time is the slowest request
+            sections = build_briefing_prompts(selected_project)
+            results = asyncio.run(_drive(agent, [prompt for _, prompt in sections]))
+            for i, ((title, _), content) in enumerate(zip(sections, results)):
+                if i:
+                    print("\n" + "=" * 70 + "\n")
+                print(title)
+                print("-" * 50)
+                print(content)
+        else:
+            # Health analysis, standup briefing and risk assessment share one request
+            # so the static agent prefix is only sent (and prefilled) once
+            print("📊 LIVE PROJECT HEALTH ANALYSIS • ☀️ DAILY STANDUP BRIEFING • ⚠️ LIVE RISK ASSESSMENT")
+            print("-" * 50)
+            agent.print_analysis(build_combined_briefing_prompt(selected_project))
     except Exception as e:
         print(f"❌ Error during live analysis: {str(e)}")
         print("Please ensure:")
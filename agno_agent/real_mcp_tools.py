@@ -5,113 +5,598 @@ Tools that enable the Agno agent to interact with actual Simple Task data via th
 This integrates with the actual aitistra.com API using the SimpleTaskService.
 """
 
+import asyncio
+import atexit
+import io
+import itertools
 import json
-import subprocess
-import tempfile
 import os
+import queue
+import subprocess
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from functools import lru_cache, wraps
+from typing import Callable, Dict, List, Any, Optional, Tuple
 
+# orjson is optional; it parses the (often large) task payloads considerably faster
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+    
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
 
-def call_mcp_tool(tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
-    """Call an MCP tool and return the result.
+
+def ttl_cache(
+    maxsize: int = 128,
+    ttl: float = 30.0,
+    cache_if: Callable[[Any], bool] = None,
+    key: Callable[..., Any] = None,
+):
+    """Memoize a function's results for ``ttl`` seconds.
+    
+    Thread-safe, with least-recently-used eviction beyond ``maxsize`` entries.
+    Concurrent calls with the same arguments share a single in-flight call.
+    Results for which ``cache_if`` returns False (e.g. errors) are not stored.
+    ``cache_clear()`` also detaches calls already in flight: their results are
+    not stored and later callers do not join them, so nothing computed before
+    the clear is served after it.
     
     Args:
-        tool_name: Name of the MCP tool to call
-        params: Parameters to pass to the tool
-        
-    Returns:
-        Tool result as dictionary
+        maxsize: Maximum number of cached results
+        ttl: Seconds a result stays valid
+        cache_if: Optional predicate deciding whether a result may be cached
+        key: Optional function building the cache key from the call arguments,
+            for arguments that are not hashable
+    """
+    def decorator(func):
+        cache: "OrderedDict[Any, tuple]" = OrderedDict()
+        inflight: Dict[Any, Future] = {}
+        lock = threading.Lock()
+        generation = 0  # Bumped by cache_clear() to invalidate in-flight calls
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs) if key else (args, tuple(sorted(kwargs.items())))
+            with lock:
+                entry = cache.get(cache_key)
+                if entry is not None and time.monotonic() - entry[0] < ttl:
+                    cache.move_to_end(cache_key)
+                    return entry[1]
+                pending = inflight.get(cache_key)
+                owner = pending is None
+                if owner:
+                    pending = inflight[cache_key] = Future()
+                    started_generation = generation
+            
+            if not owner:
+                return pending.result()
+            
+            try:
+                value = func(*args, **kwargs)
+            except BaseException as e:
+                with lock:
+                    if inflight.get(cache_key) is pending:
+                        del inflight[cache_key]
+                pending.set_exception(e)
+                raise
+            
+            with lock:
+                if inflight.get(cache_key) is pending:
+                    del inflight[cache_key]
+                if generation == started_generation and (cache_if is None or cache_if(value)):
+                    cache[cache_key] = (time.monotonic(), value)
+                    cache.move_to_end(cache_key)
+                    while len(cache) > maxsize:
+                        cache.popitem(last=False)
+            pending.set_result(value)
+            return value
+        
+        def cache_clear() -> None:
+            nonlocal generation
+            with lock:
+                cache.clear()
+                inflight.clear()
+                generation += 1
+        
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+
+MCP_PROTOCOL_VERSION = "2024-11-05"
+MCP_CALL_TIMEOUT = 30
+# Server calls mostly wait on the aitistra.com API rather than the CPU, so the pool
+# is sized for the concurrent calls an analysis makes (up to four prefetched
+# tools), not for the number of cores
+MCP_POOL_SIZE = 4
+
+# Fixed head of every tools/call request; only the tool name, arguments and id vary
+_TOOLS_CALL_PREFIX = b'{"jsonrpc":"2.0","method":"tools/call","params":{"name":'
+
+
+@lru_cache(maxsize=1)
+def _mcp_server_path() -> str:
+    """Get the MCP server build directory.
+    
+    Resolved on first use rather than at import, so an MCP_SERVER_PATH loaded
+    from a .env file after this module is imported is still honoured.
     """
     # Get the script directory and construct the MCP server path relative to it
     script_dir = os.path.dirname(os.path.abspath(__file__))
     default_mcp_path = os.path.join(script_dir, "..", "mcp_server", "build")
-    mcp_server_path = os.getenv("MCP_SERVER_PATH", default_mcp_path)
-    
-    # Create a temporary script to call the MCP server
-    script_content = f"""
-const {{ spawn }} = require('child_process');
-
-const serverProcess = spawn('node', ['{mcp_server_path}/index.js'], {{
-    stdio: ['pipe', 'pipe', 'pipe']
-}});
-
-const request = {{
-    jsonrpc: '2.0',
-    id: 1,
-    method: 'tools/call',
-    params: {{
-        name: '{tool_name}',
-        arguments: {json.dumps(params)}
-    }}
-}};
-
-serverProcess.stdin.write(JSON.stringify(request) + '\\n');
-serverProcess.stdin.end();
-
-let output = '';
-serverProcess.stdout.on('data', (data) => {{
-    output += data.toString();
-}});
-
-serverProcess.stderr.on('data', (data) => {{
-    console.error('MCP Error:', data.toString());
-}});
-
-serverProcess.on('close', (code) => {{
-    try {{
-        const lines = output.split('\\n').filter(line => line.trim());
-        for (const line of lines) {{
-            try {{
-                const parsed = JSON.parse(line);
-                if (parsed.result) {{
-                    console.log(JSON.stringify(parsed.result, null, 2));
-                    return;
-                }}
-            }} catch (e) {{
-                // Not JSON, continue
-            }}
-        }}
-        console.log(JSON.stringify({{ error: 'No valid response found', raw_output: output }}, null, 2));
-    }} catch (error) {{
-        console.log(JSON.stringify({{ error: error.message, raw_output: output }}, null, 2));
-    }}
-}});
-"""
+    return os.getenv("MCP_SERVER_PATH", default_mcp_path)
+
+
+def _parse_text_content(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Attach the JSON body of a tool result's first text block as ``result["_parsed"]``.
     
-    try:
-        # Write the script to a temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.js', delete=False) as f:
-            f.write(script_content)
-            script_path = f.name
-        
-        # Execute the script
-        result = subprocess.run(
-            ['node', script_path],
-            capture_output=True,
-            text=True,
-            timeout=30
+    Tools return their data as JSON inside ``content[0].text``; parsing it once
+    here saves every consumer of the (possibly cached) result from doing so.
+    Results whose text is not JSON are returned unchanged.
+    """
+    content = result.get("content")
+    if content and content[0].get("type") == "text":
+        try:
+            result["_parsed"] = _loads(content[0].get("text", ""))
+        except ValueError:
+            pass
+    return result
+
+
+class MCPSession:
+    """A long-lived stdio connection to the Simple Task MCP server.
+    
+    The server process is started and initialized once; each tool call is then a
+    single JSON-RPC request/response over the open pipes. A session handles one
+    request at a time, so callers should check it out through MCPSessionPool.
+    """
+    
+    def __init__(self, server_path: str):
+        self.process = subprocess.Popen(
+            ["node", os.path.join(server_path, "index.js")],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
         )
+        self.last_used = time.monotonic()
+        self.project: Optional[str] = None  # Default project selected on this server, None if never switched
+        self._next_id = 0
+        self._messages: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        threading.Thread(target=self._read_messages, daemon=True).start()
+        
+        try:
+            self._request("initialize", {
+                "protocolVersion": MCP_PROTOCOL_VERSION,
+                "capabilities": {},
+                "clientInfo": {"name": "simple-task-agno-agent", "version": "1.0.0"},
+            })
+            self._send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        except Exception:
+            self.close()
+            raise
+    
+    def _read_messages(self) -> None:
+        """Forward JSON-RPC messages from the server's stdout to the message queue."""
+        for line in self.process.stdout:
+            try:
+                self._messages.put(_loads(line))
+            except json.JSONDecodeError:
+                continue  # Not JSON-RPC, ignore
+        self._messages.put(None)  # Server exited
+    
+    def _send(self, message: Dict[str, Any]) -> None:
+        self._write(_dumps(message) + b"\n")
+    
+    def _write(self, payload: bytes) -> None:
+        self.process.stdin.write(payload)
+        self.process.stdin.flush()
+    
+    def _new_request_id(self) -> int:
+        self._next_id += 1
+        return self._next_id
+    
+    def _request(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a request and wait for the response with the matching id."""
+        request_id = self._new_request_id()
+        self._send({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params})
+        return self._await_response(request_id)
+    
+    def _await_response(self, request_id: int) -> Dict[str, Any]:
+        """Wait for the response to the request with the given id."""
+        deadline = time.monotonic() + MCP_CALL_TIMEOUT
+        while True:
+            try:
+                message = self._messages.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                self.close()  # A late response would be read by the next request
+                raise TimeoutError("MCP call timed out")
+            if message is None:
+                raise ConnectionError(f"MCP server exited with code {self.process.poll()}")
+            if message.get("id") == request_id:
+                return message
+    
+    def list_tools(self) -> List[Dict[str, Any]]:
+        """List the tools exposed by the server."""
+        self.last_used = time.monotonic()
+        response = self._request("tools/list", {})
+        if "error" in response:
+            raise RuntimeError(f"MCP tools/list failed: {response['error'].get('message', response['error'])}")
+        return response.get("result", {}).get("tools", [])
+    
+    def call_tool(self, tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Call an MCP tool on this session.
+        
+        Returns:
+            Tool result, or a dictionary with an "error" key on failure
+        """
+        self.last_used = time.monotonic()
+        request_id = self._new_request_id()
+        self._write(
+            _TOOLS_CALL_PREFIX + _dumps(tool_name)
+            + b',"arguments":' + _dumps(params)
+            + b'},"id":' + str(request_id).encode() + b"}\n"
+        )
+        response = self._await_response(request_id)
         
-        # Clean up
-        os.unlink(script_path)
+        if "error" in response:
+            return {"error": f"MCP call failed: {response['error'].get('message', response['error'])}"}
         
-        if result.returncode == 0:
+        result = response.get("result", {})
+        if result.get("isError"):
+            content = result.get("content") or [{}]
+            return {"error": content[0].get("text", "Unknown MCP error")}
+        return _parse_text_content(result)
+    
+    def is_alive(self) -> bool:
+        return self.process.poll() is None
+    
+    def close(self) -> None:
+        """Terminate the server process."""
+        if self.is_alive():
+            self.process.terminate()
             try:
-                return json.loads(result.stdout)
-            except json.JSONDecodeError:
-                return {"error": "Failed to parse MCP response", "raw_output": result.stdout}
-        else:
-            return {"error": f"MCP call failed: {result.stderr}", "return_code": result.returncode}
-            
-    except subprocess.TimeoutExpired:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+
+class MCPSessionPool:
+    """Pool of reusable MCP sessions.
+    
+    Sessions are checked out exclusively, returned after use, and closed once they
+    have been idle for longer than session_ttl. At most max_sessions server
+    processes run at once; further callers wait for a session to be returned.
+    Concurrent callers therefore run on separate server processes instead of
+    queueing behind a single stdin/stdout pair.
+    
+    The default project chosen with switch_project() applies to the whole pool:
+    each session is switched to it when checked out, if it is not already.
+    """
+    
+    def __init__(self, max_sessions: int = MCP_POOL_SIZE, session_ttl: float = 300.0):
+        self.max_sessions = max_sessions
+        self.session_ttl = session_ttl
+        self._idle: List[MCPSession] = []
+        self._sessions: set = set()  # Every live session, idle or checked out
+        self._open = 0
+        self._condition = threading.Condition()
+        self.project: Optional[str] = None  # Pool-wide default project, None for the server default
+    
+    @contextmanager
+    def acquire(self):
+        """Check out a session for the duration of the ``with`` block."""
+        session = self._checkout()
+        try:
+            self._sync_project(session)
+            yield session
+        finally:
+            self._checkin(session)
+    
+    def switch_project(self, project_name: str) -> Dict[str, Any]:
+        """Make project_name the default project of every pooled session.
+        
+        The switch is validated on one session; the others follow on their next
+        checkout.
+        
+        Returns:
+            Tool result of the switch, or a dictionary with an "error" key
+        """
+        with self.acquire() as session:
+            result = session.call_tool("simpletask_switch_project", {"project_identifier": project_name})
+            if "error" not in result:
+                session.project = project_name
+                with self._condition:
+                    self.project = project_name
+        return result
+    
+    def _sync_project(self, session: MCPSession) -> None:
+        """Switch a checked-out session to the pool's default project if needed."""
+        project = self.project
+        if project is None or session.project == project:
+            return
+        result = session.call_tool("simpletask_switch_project", {"project_identifier": project})
+        if "error" in result:
+            raise RuntimeError(f"Could not switch MCP session to project {project}: {result['error']}")
+        session.project = project
+    
+    def _checkout(self) -> MCPSession:
+        with self._condition:
+            while True:
+                self._expire_idle()
+                if self._idle:
+                    return self._idle.pop()
+                if self._open < self.max_sessions:
+                    self._open += 1
+                    break
+                self._condition.wait()
+        
+        try:
+            session = MCPSession(_mcp_server_path())
+        except Exception:
+            with self._condition:
+                self._open -= 1
+                self._condition.notify()
+            raise
+        
+        with self._condition:
+            self._sessions.add(session)
+        return session
+    
+    def _checkin(self, session: MCPSession) -> None:
+        with self._condition:
+            if session.is_alive():
+                session.last_used = time.monotonic()
+                self._idle.append(session)
+            else:
+                self._sessions.discard(session)
+                self._open -= 1
+            self._condition.notify()
+    
+    def _expire_idle(self) -> None:
+        """Close idle sessions past their TTL or whose server has exited (lock held)."""
+        now = time.monotonic()
+        keep = []
+        for session in self._idle:
+            if session.is_alive() and now - session.last_used < self.session_ttl:
+                keep.append(session)
+            else:
+                session.close()
+                self._sessions.discard(session)
+                self._open -= 1
+        self._idle = keep
+    
+    def close(self) -> None:
+        """Terminate every session's server process, including checked-out ones.
+        
+        In-flight calls on a checked-out session fail and the session is dropped
+        when it is returned.
+        """
+        with self._condition:
+            for session in self._sessions:
+                session.close()
+            self._open -= len(self._idle)
+            self._sessions = {session for session in self._sessions if session not in self._idle}
+            self._idle = []
+
+
+_session_pool = MCPSessionPool()
+atexit.register(_session_pool.close)
+
+# Agents often re-invoke the same read-only tool within one analysis turn; serve
+# repeats from memory for a short window. Failure messages are never cached.
+TOOL_CACHE_TTL = 30.0
+_tool_output_caches: List[Callable[..., str]] = []  # Cleared by call_mcp_tool on writes
+# Every failure message the report tools return starts or ends with one of these
+_FAILURE_PREFIX = "Error"
+_NO_DATA_SUFFIX = "data received from MCP server"
+
+
+def _is_report(output: str) -> bool:
+    """Whether a report tool's output is a report rather than a failure message."""
+    return not output.startswith(_FAILURE_PREFIX) and not output.endswith(_NO_DATA_SUFFIX)
+
+
+def _cache_tool_output(func: Callable[..., str]) -> Callable[..., str]:
+    """Cache a report tool's successful output for TOOL_CACHE_TTL seconds."""
+    cached = ttl_cache(maxsize=64, ttl=TOOL_CACHE_TTL, cache_if=_is_report)(func)
+    _tool_output_caches.append(cached)
+    return cached
+
+
+# Read-only MCP tools whose responses may be reused for MCP_RESPONSE_CACHE_TTL seconds;
+# any other tool is treated as a write and invalidates the response cache
+READ_ONLY_TOOL_PREFIXES = ("simpletask_get_", "simpletask_list_", "simpletask_search_")
+MCP_RESPONSE_CACHE_TTL = 5.0
+BATCH_TOOL_NAME = "batch_execute"
+
+
+def _is_read_only(tool_name: str, params: Dict[str, Any]) -> bool:
+    """Whether a tool call only reads data; a batch is read-only if all its operations are."""
+    if tool_name == BATCH_TOOL_NAME:
+        return all(
+            operation.get("tool", "").startswith(READ_ONLY_TOOL_PREFIXES)
+            for operation in params.get("operations", [])
+        )
+    return tool_name.startswith(READ_ONLY_TOOL_PREFIXES)
+
+
+def _dispatch_mcp_tool(tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Send a tool call to the MCP server over a pooled session."""
+    try:
+        with _session_pool.acquire() as session:
+            return session.call_tool(tool_name, params)
+    except TimeoutError:
         return {"error": "MCP call timed out"}
     except Exception as e:
         return {"error": f"Unexpected error: {str(e)}"}
 
 
+@ttl_cache(
+    maxsize=128,
+    ttl=MCP_RESPONSE_CACHE_TTL,
+    cache_if=lambda result: "error" not in result,
+    key=lambda tool_name, params: (tool_name, json.dumps(params, sort_keys=True)),
+)
+def _cached_mcp_tool(tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    return _dispatch_mcp_tool(tool_name, params)
+
+
+def call_mcp_tool(tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Call an MCP tool and return the result.
+    
+    Responses from read-only tools are reused for a few seconds; errors are
+    never cached. Calling any other tool clears both the response cache and
+    the cached report tool outputs, so no report is served stale after a write.
+    
+    Args:
+        tool_name: Name of the MCP tool to call
+        params: Parameters to pass to the tool
+        
+    Returns:
+        Tool result as dictionary
+    """
+    if _is_read_only(tool_name, params):
+        return _cached_mcp_tool(tool_name, params)
+    
+    result = _dispatch_mcp_tool(tool_name, params)
+    _clear_caches()
+    return result
+
+
+def _clear_caches() -> None:
+    """Drop cached MCP responses and report tool outputs after a write."""
+    _cached_mcp_tool.cache_clear()
+    for cached in _tool_output_caches:
+        cached.cache_clear()
+
+
+async def acall_mcp_tool(tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Asynchronous variant of call_mcp_tool for use with asyncio.gather.
+    
+    The call runs on a worker thread over the shared session pool, so concurrent
+    calls are spread across the pooled server processes.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, call_mcp_tool, tool_name, params)
+
+
+BATCH_MAX_CONCURRENT = 4
+
+
+@lru_cache(maxsize=1)
+def _supports_batch() -> bool:
+    """Whether the MCP server exposes the batch tool, checked once via tools/list.
+    
+    A failed tools/list is remembered as no support rather than retried, so a
+    broken listing does not add a timeout to every batch.
+    """
+    try:
+        with _session_pool.acquire() as session:
+            return any(tool.get("name") == BATCH_TOOL_NAME for tool in session.list_tools())
+    except Exception:
+        return False
+
+
+def batch_mcp_calls(calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Run several MCP tool calls, in one round-trip when the server supports it.
+    
+    Servers exposing a ``batch_execute`` aggregator tool receive all calls as a
+    single request; otherwise the calls are dispatched concurrently over the
+    session pool.
+    
+    Args:
+        calls: List of (tool_name, params) pairs
+        
+    Returns:
+        Tool results in the same order as ``calls``
+    """
+    if not _supports_batch():
+        with ThreadPoolExecutor(max_workers=min(len(calls), BATCH_MAX_CONCURRENT) or 1) as executor:
+            return list(executor.map(lambda call: call_mcp_tool(*call), calls))
+    
+    batch_data = call_mcp_tool(BATCH_TOOL_NAME, {
+        "operations": [{"tool": tool_name, "arguments": params} for tool_name, params in calls],
+        "options": {"maxConcurrent": BATCH_MAX_CONCURRENT, "stopOnError": False},
+    })
+    if "error" in batch_data:
+        return [batch_data] * len(calls)
+    
+    try:
+        results = batch_data["_parsed"]["results"]
+    except (KeyError, TypeError):
+        return [{"error": "Failed to parse batch response"}] * len(calls)
+    if not isinstance(results, list) or len(results) != len(calls):
+        return [{"error": "Batch response does not match the requested calls"}] * len(calls)
+    
+    return [
+        _parse_text_content(result.get("result", {})) if result.get("success", True) else {"error": result.get("error", "Batch operation failed")}
+        for result in results
+    ]
+
+
+def get_dashboard(project_name: str = None) -> str:
+    """Get the task overview, blocked tasks and high priority tasks together.
+    
+    The three underlying MCP calls are issued as one batch.
+    
+    Args:
+        project_name: Project to analyze (optional)
+        
+    Returns:
+        Overview, blocked task and high priority task reports
+    """
+    overview_data, blocked_data, high_priority_data = batch_mcp_calls([
+        _overview_call(project_name),
+        _blocked_call(project_name),
+        _high_priority_call(project_name),
+    ])
+    return _format_dashboard(overview_data, blocked_data, high_priority_data, project_name)
+
+
+async def aget_dashboard(project_name: str = None) -> str:
+    """Asynchronous get_dashboard; the three MCP calls run concurrently.
+    
+    Args:
+        project_name: Project to analyze (optional)
+        
+    Returns:
+        Overview, blocked task and high priority task reports
+    """
+    overview_data, blocked_data, high_priority_data = await asyncio.gather(
+        acall_mcp_tool(*_overview_call(project_name)),
+        acall_mcp_tool(*_blocked_call(project_name)),
+        acall_mcp_tool(*_high_priority_call(project_name)),
+    )
+    return _format_dashboard(overview_data, blocked_data, high_priority_data, project_name)
+
+
+def _format_dashboard(
+    overview_data: Dict[str, Any],
+    blocked_data: Dict[str, Any],
+    high_priority_data: Dict[str, Any],
+    project_name: str = None,
+) -> str:
+    """Join the overview, blocked and high priority reports into one dashboard."""
+    sections = (
+        _format_overview(overview_data, project_name),
+        _format_blocked(blocked_data),
+        _format_high_priority(high_priority_data),
+    )
+    return "\n\n".join(section.rstrip("\n") for section in sections)
+
+
 def switch_project(project_name: str) -> str:
-    """Switch to a specific project in the MCP server session.
+    """Switch the default project used by every MCP server session.
+    
+    Applies to tool calls that do not pass project_name explicitly.
     
     Args:
         project_name: Project to switch to
@@ -120,7 +605,10 @@ def switch_project(project_name: str) -> str:
         Status of project switch
     """
     try:
-        result = call_mcp_tool("simpletask_switch_project", {"project_identifier": project_name})
+        try:
+            result = _session_pool.switch_project(project_name)
+        finally:
+            _clear_caches()
         
         if "error" in result:
             return f"Error switching to project: {result['error']}"
@@ -131,6 +619,56 @@ def switch_project(project_name: str) -> str:
         return f"Error switching to project: {str(e)}"
 
 
+# Display labels for the handful of status/priority values the API returns
+_STATUS_LABEL = {
+    "blocked": "Blocked",
+    "todo": "Todo",
+    "in_progress": "In Progress",
+    "review": "Review",
+    "completed": "Completed",
+    "unknown": "Unknown",
+}
+_PRIORITY_LABEL = {
+    "high": "High",
+    "medium": "Medium",
+    "low": "Low",
+    "unknown": "Unknown",
+}
+
+
+def _status_label(status: str) -> str:
+    """Human-readable label for a task status."""
+    return _STATUS_LABEL.get(status) or status.replace('_', ' ').title()
+
+
+def _priority_label(priority: str) -> str:
+    """Human-readable label for a task priority."""
+    return _PRIORITY_LABEL.get(priority) or priority.title()
+
+
+class _Task:
+    """The task fields the reports read, copied out of a task dictionary once."""
+    
+    __slots__ = ("id", "title", "status", "priority", "assigned_to", "created_at", "depends_on", "description")
+    
+    def __init__(self, data: Dict[str, Any]):
+        self.id = data.get("id", "unknown")
+        self.title = data.get("title", "Untitled")
+        self.status = data.get("status", "unknown")
+        self.priority = data.get("priority", "unknown")
+        self.assigned_to = data.get("assigned_to")
+        self.created_at = data.get("created_at", "")
+        self.depends_on = data.get("depends_on", [])
+        self.description = data.get("description", "")
+
+
+@lru_cache(maxsize=256)
+def _display(member: str) -> str:
+    """Display name for a team member, derived from their email if it is one."""
+    return member.split('@')[0].title() if '@' in member else member
+
+
+@_cache_tool_output
 def get_simple_task_overview(project_name: str = None) -> str:
     """Get an overview of tasks in the Simple Task project.
     
@@ -140,19 +678,27 @@ def get_simple_task_overview(project_name: str = None) -> str:
     Returns:
         Formatted overview of tasks
     """
-    try:
-        # Get task summaries using the MCP server with project_name parameter
-        params = {
-            "limit": 100,
-            "offset": 0,
-            "include_full_data": False
-        }
-        
-        if project_name:
-            params["project_name"] = project_name
-            
-        summary_data = call_mcp_tool("simpletask_get_tasks_summary", params)
+    return _format_overview(call_mcp_tool(*_overview_call(project_name)), project_name)
+
+
+def _overview_call(project_name: str = None) -> Tuple[str, Dict[str, Any]]:
+    """Build the MCP call behind get_simple_task_overview."""
+    # Get task summaries using the MCP server with project_name parameter
+    params = {
+        "limit": 100,
+        "offset": 0,
+        "include_full_data": False
+    }
+    
+    if project_name:
+        params["project_name"] = project_name
         
+    return "simpletask_get_tasks_summary", params
+
+
+def _format_overview(summary_data: Dict[str, Any], project_name: str = None) -> str:
+    """Format a simpletask_get_tasks_summary response as a task overview."""
+    try:
         if "error" in summary_data:
             return f"Error getting tasks: {summary_data['error']}"
         
@@ -160,66 +706,54 @@ def get_simple_task_overview(project_name: str = None) -> str:
         if "content" in summary_data and len(summary_data["content"]) > 0:
             content = summary_data["content"][0].get("text", "")
             try:
-                # The content is JSON string, parse it
-                task_data = json.loads(content)
-                items = task_data.get("items", [])
+                # The content is JSON string, parsed by call_mcp_tool when possible
+                task_data = summary_data["_parsed"] if "_parsed" in summary_data else _loads(content)
+                items = [_Task(task) for task in task_data.get("items", [])]
                 total = task_data.get("total_count", len(items))
             except json.JSONDecodeError:
                 return f"Error parsing task data: {content[:200]}..."
         else:
-            return "No task data received from MCP server"
+            return f"No task {_NO_DATA_SUFFIX}"
         
         # Analyze status distribution
-        status_counts = {}
-        priority_counts = {}
-        
-        for task in items:
-            status = task.get("status", "unknown")
-            priority = task.get("priority", "unknown")
-            
-            status_counts[status] = status_counts.get(status, 0) + 1
-            priority_counts[priority] = priority_counts.get(priority, 0) + 1
+        status_counts = Counter(task.status for task in items)
+        priority_counts = Counter(task.priority for task in items)
+        scale = 100.0 / len(items) if items else 0.0  # count -> percentage of all tasks
         
         # Format overview
-        overview = [
-            f"# Simple Task Overview",
-            f"**Total Tasks**: {total}",
-            f"**Project**: {project_name or 'Default Project'}",
-            f"**Data Source**: aitistra.com API",
-            "",
-            "## Status Distribution:",
-        ]
+        overview = io.StringIO()
+        overview.write(
+            f"# Simple Task Overview\n"
+            f"**Total Tasks**: {total}\n"
+            f"**Project**: {project_name or 'Default Project'}\n"
+            f"**Data Source**: aitistra.com API\n"
+            f"\n"
+            f"## Status Distribution:\n"
+        )
         
         for status, count in sorted(status_counts.items()):
-            percentage = (count / len(items)) * 100 if items else 0
-            overview.append(f"- **{status.replace('_', ' ').title()}**: {count} ({percentage:.1f}%)")
+            overview.write(f"- **{_status_label(status)}**: {count} ({count * scale:.1f}%)\n")
         
-        overview.extend([
-            "",
-            "## Priority Distribution:",
-        ])
+        overview.write("\n## Priority Distribution:\n")
         
         for priority, count in sorted(priority_counts.items()):
-            percentage = (count / len(items)) * 100 if items else 0
-            overview.append(f"- **{priority.title()}**: {count} ({percentage:.1f}%)")
+            overview.write(f"- **{_priority_label(priority)}**: {count} ({count * scale:.1f}%)\n")
         
         # Add recent high-priority tasks
-        high_priority_tasks = [t for t in items if t.get("priority") == "high"][:5]
+        high_priority_tasks = list(itertools.islice((t for t in items if t.priority == "high"), 5))
         if high_priority_tasks:
-            overview.extend([
-                "",
-                "## Recent High Priority Tasks:",
-            ])
+            overview.write("\n## Recent High Priority Tasks:\n")
             for task in high_priority_tasks:
-                status_badge = f"[{task.get('status', 'unknown').replace('_', ' ').title()}]"
-                overview.append(f"- {status_badge} **{task.get('title', 'Untitled')}**")
+                status_badge = f"[{_status_label(task.status)}]"
+                overview.write(f"- {status_badge} **{task.title}**\n")
         
-        return "\\n".join(overview)
+        return overview.getvalue()
         
     except Exception as e:
         return f"Error analyzing tasks: {str(e)}"
 
 
+@_cache_tool_output
 def get_blocked_tasks(project_name: str = None) -> str:
     """Get tasks that are currently blocked.
     
@@ -229,20 +763,28 @@ def get_blocked_tasks(project_name: str = None) -> str:
     Returns:
         Formatted list of blocked tasks
     """
-    try:
-        # Get blocked tasks using the MCP server with project_name parameter
-        params = {
-            "status": "blocked",
-            "limit": 50,
-            "offset": 0,
-            "include_full_data": True
-        }
-        
-        if project_name:
-            params["project_name"] = project_name
-            
-        blocked_data = call_mcp_tool("simpletask_get_tasks_by_status", params)
+    return _format_blocked(call_mcp_tool(*_blocked_call(project_name)))
+
+
+def _blocked_call(project_name: str = None) -> Tuple[str, Dict[str, Any]]:
+    """Build the MCP call behind get_blocked_tasks."""
+    # Get blocked tasks using the MCP server with project_name parameter
+    params = {
+        "status": "blocked",
+        "limit": 50,
+        "offset": 0,
+        "include_full_data": True  # Dependencies and description are not in the summary
+    }
+    
+    if project_name:
+        params["project_name"] = project_name
         
+    return "simpletask_get_tasks_by_status", params
+
+
+def _format_blocked(blocked_data: Dict[str, Any]) -> str:
+    """Format a simpletask_get_tasks_by_status response as a blocked task list."""
+    try:
         if "error" in blocked_data:
             return f"Error getting blocked tasks: {blocked_data['error']}"
         
@@ -250,55 +792,59 @@ def get_blocked_tasks(project_name: str = None) -> str:
         if "content" in blocked_data and len(blocked_data["content"]) > 0:
             content = blocked_data["content"][0].get("text", "")
             try:
-                # The content is JSON string, parse it
-                task_data = json.loads(content)
-                items = task_data.get("items", [])
+                # The content is JSON string, parsed by call_mcp_tool when possible
+                task_data = blocked_data["_parsed"] if "_parsed" in blocked_data else _loads(content)
+                items = [_Task(task) for task in task_data.get("items", [])]
             except json.JSONDecodeError:
                 return f"Error parsing blocked tasks data: {content[:200]}..."
         else:
-            return "No blocked tasks data received from MCP server"
+            return f"No blocked tasks {_NO_DATA_SUFFIX}"
         
         if not items:
             return "✅ No blocked tasks found!"
         
-        result = [
-            f"# Blocked Tasks ({len(items)} found)",
-            f"**Data Source**: aitistra.com API",
-            ""
-        ]
+        result = io.StringIO()
+        result.write(
+            f"# Blocked Tasks ({len(items)} found)\n"
+            f"**Data Source**: aitistra.com API\n"
+            f"\n"
+        )
         
         for i, task in enumerate(items, 1):
-            title = task.get("title", "Untitled")
-            priority = task.get("priority", "unknown").title()
-            assigned = task.get("assigned_to") or "Unassigned"
-            dependencies = task.get("depends_on", [])
-            created_at = task.get("created_at", "")
+            title = task.title
+            priority = _priority_label(task.priority)
+            assigned = task.assigned_to or "Unassigned"
+            dependencies = task.depends_on
+            created_at = task.created_at
             
-            result.extend([
-                f"## {i}. {title}",
-                f"- **Priority**: {priority}",
-                f"- **Assigned to**: {assigned}",
-                f"- **Created**: {created_at[:10] if created_at else 'Unknown'}",
-            ])
+            result.write(
+                f"## {i}. {title}\n"
+                f"- **Priority**: {priority}\n"
+                f"- **Assigned to**: {assigned}\n"
+                f"- **Created**: {created_at[:10] if created_at else 'Unknown'}\n"
+            )
             
             if dependencies:
-                result.append(f"- **Depends on**: {len(dependencies)} task(s)")
+                result.write(f"- **Depends on**: {len(dependencies)} task(s)\n")
             
-            description = task.get("description", "").strip()
+            description = task.description.strip()
             if description:
                 # Truncate long descriptions
+                result.write("- **Description**: ")
+                result.write(description[:200])
                 if len(description) > 200:
-                    description = description[:200] + "..."
-                result.append(f"- **Description**: {description}")
+                    result.write("...")
+                result.write("\n")
             
-            result.append("")
+            result.write("\n")
         
-        return "\\n".join(result)
+        return result.getvalue()
         
     except Exception as e:
         return f"Error analyzing blocked tasks: {str(e)}"
 
 
+@_cache_tool_output
 def get_high_priority_tasks(project_name: str = None) -> str:
     """Get high priority tasks that need attention.
     
@@ -308,20 +854,28 @@ def get_high_priority_tasks(project_name: str = None) -> str:
     Returns:
         Formatted list of high priority tasks
     """
-    try:
-        # Get high priority tasks using the MCP server with project_name parameter
-        params = {
-            "priority": "high",
-            "limit": 25,
-            "offset": 0,
-            "include_full_data": True
-        }
-        
-        if project_name:
-            params["project_name"] = project_name
-            
-        high_priority_data = call_mcp_tool("simpletask_get_tasks_by_priority", params)
+    return _format_high_priority(call_mcp_tool(*_high_priority_call(project_name)))
+
+
+def _high_priority_call(project_name: str = None) -> Tuple[str, Dict[str, Any]]:
+    """Build the MCP call behind get_high_priority_tasks."""
+    # Get high priority tasks using the MCP server with project_name parameter
+    params = {
+        "priority": "high",
+        "limit": 25,
+        "offset": 0,
+        "include_full_data": False  # The summary fields are all the report shows
+    }
+    
+    if project_name:
+        params["project_name"] = project_name
         
+    return "simpletask_get_tasks_by_priority", params
+
+
+def _format_high_priority(high_priority_data: Dict[str, Any]) -> str:
+    """Format a simpletask_get_tasks_by_priority response grouped by status."""
+    try:
         if "error" in high_priority_data:
             return f"Error getting high priority tasks: {high_priority_data['error']}"
         
@@ -329,30 +883,28 @@ def get_high_priority_tasks(project_name: str = None) -> str:
         if "content" in high_priority_data and len(high_priority_data["content"]) > 0:
             content = high_priority_data["content"][0].get("text", "")
             try:
-                # The content is JSON string, parse it
-                task_data = json.loads(content)
-                items = task_data.get("items", [])
+                # The content is JSON string, parsed by call_mcp_tool when possible
+                task_data = high_priority_data["_parsed"] if "_parsed" in high_priority_data else _loads(content)
+                items = [_Task(task) for task in task_data.get("items", [])]
             except json.JSONDecodeError:
                 return f"Error parsing high priority tasks data: {content[:200]}..."
         else:
-            return "No high priority tasks data received from MCP server"
+            return f"No high priority tasks {_NO_DATA_SUFFIX}"
         
         if not items:
             return "No high priority tasks found."
         
         # Group by status
-        by_status = {}
+        by_status = defaultdict(list)
         for task in items:
-            status = task.get("status", "unknown")
-            if status not in by_status:
-                by_status[status] = []
-            by_status[status].append(task)
+            by_status[task.status].append(task)
         
-        result = [
-            f"# High Priority Tasks ({len(items)} found)",
-            f"**Data Source**: aitistra.com API",
-            ""
-        ]
+        result = io.StringIO()
+        result.write(
+            f"# High Priority Tasks ({len(items)} found)\n"
+            f"**Data Source**: aitistra.com API\n"
+            f"\n"
+        )
         
         # Order statuses by urgency
         status_order = ["blocked", "todo", "in_progress", "review", "completed"]
@@ -362,29 +914,27 @@ def get_high_priority_tasks(project_name: str = None) -> str:
                 continue
                 
             tasks = by_status[status]
-            result.extend([
-                f"## {status.replace('_', ' ').title()} ({len(tasks)})",
-                ""
-            ])
+            result.write(f"## {_status_label(status)} ({len(tasks)})\n\n")
             
             for task in tasks:
-                title = task.get("title", "Untitled")
-                assigned = task.get("assigned_to") or "Unassigned"
-                created_at = task.get("created_at", "")
-                task_id = task.get("id", "unknown")
+                title = task.title
+                assigned = task.assigned_to or "Unassigned"
+                created_at = task.created_at
+                task_id = task.id
                 
-                result.append(f"- **{title}** (ID: {task_id}, Assigned: {assigned})")
+                result.write(f"- **{title}** (ID: {task_id}, Assigned: {assigned})\n")
                 if created_at:
-                    result.append(f"  Created: {created_at[:10]}")
+                    result.write(f"  Created: {created_at[:10]}\n")
             
-            result.append("")
+            result.write("\n")
         
-        return "\\n".join(result)
+        return result.getvalue()
         
     except Exception as e:
         return f"Error analyzing high priority tasks: {str(e)}"
 
 
+@_cache_tool_output
 def analyze_team_workload(project_name: str = None) -> str:
     """Analyze team workload distribution from real data.
     
@@ -395,106 +945,104 @@ def analyze_team_workload(project_name: str = None) -> str:
         Workload analysis report
     """
     try:
-        # Switch to the project first if specified
-        if project_name:
-            switch_result = switch_project(project_name)
-            if "Error" in switch_result:
-                return f"Project switch failed: {switch_result}"
-        
-        # Get all tasks using the MCP server
+        # Get all tasks using the MCP server with project_name parameter
         params = {
             "limit": 200,
             "offset": 0,
-            "include_full_data": True
+            "include_full_data": False  # Only assignee, priority and status are counted
         }
+        
+        if project_name:
+            params["project_name"] = project_name
             
         tasks_data = call_mcp_tool("simpletask_get_tasks", params)
         
         if "error" in tasks_data:
             return f"Error getting tasks: {tasks_data['error']}"
         
-        items = tasks_data.get("items", [])
+        if not tasks_data.get("content"):
+            return f"No task {_NO_DATA_SUFFIX}"
         
-        if not items:
-            return "No tasks found for workload analysis."
+        if "_parsed" not in tasks_data:
+            return f"Error parsing task data: {tasks_data['content'][0].get('text', '')[:200]}..."
         
-        # Analyze task assignments
-        workload = {}
+        # Analyze task assignments, keeping one column of per-member counts for each metric
+        totals = Counter()
+        high_counts = Counter()
+        status_counts = {status: Counter() for status in ("blocked", "in_progress", "completed", "todo")}
         unassigned_count = 0
-        total_tasks = len(items)
+        total_tasks = 0
         
-        for task in items:
-            assigned = task.get("assigned_to")
+        for task in map(_Task, tasks_data["_parsed"].get("items", [])):
+            total_tasks += 1
+            assigned = task.assigned_to
             if not assigned:
                 unassigned_count += 1
                 continue
-                
-            if assigned not in workload:
-                workload[assigned] = {
-                    "total": 0, 
-                    "high": 0, 
-                    "blocked": 0, 
-                    "in_progress": 0,
-                    "completed": 0,
-                    "todo": 0
-                }
             
-            workload[assigned]["total"] += 1
+            totals[assigned] += 1
             
             # Count by priority
-            if task.get("priority") == "high":
-                workload[assigned]["high"] += 1
+            if task.priority == "high":
+                high_counts[assigned] += 1
                 
             # Count by status
-            status = task.get("status", "unknown")
-            if status in workload[assigned]:
-                workload[assigned][status] += 1
-        
-        result = [
-            "# Team Workload Analysis",
-            f"**Total Active Tasks**: {total_tasks}",
-            f"**Unassigned Tasks**: {unassigned_count} ({(unassigned_count/total_tasks)*100:.1f}%)",
-            f"**Data Source**: aitistra.com API",
-            "",
-            "## Individual Workloads:",
-            ""
-        ]
+            column = status_counts.get(task.status)
+            if column is not None:
+                column[assigned] += 1
+        
+        if not total_tasks:
+            return "No tasks found for workload analysis."
+        
+        result = io.StringIO()
+        result.write(
+            f"# Team Workload Analysis\n"
+            f"**Total Active Tasks**: {total_tasks}\n"
+            f"**Unassigned Tasks**: {unassigned_count} ({(unassigned_count/total_tasks)*100:.1f}%)\n"
+            f"**Data Source**: aitistra.com API\n"
+            f"\n"
+            f"## Individual Workloads:\n"
+            f"\n"
+        )
         
         # Sort team members by total workload (descending)
-        sorted_workload = sorted(workload.items(), key=lambda x: x[1]["total"], reverse=True)
+        sorted_workload = sorted(totals.items(), key=lambda x: x[1], reverse=True)
         
-        for member, load in sorted_workload:
-            # Extract name from email if it's an email
-            display_name = member.split('@')[0].title() if '@' in member else member
+        for member, total in sorted_workload:
+            high = high_counts[member]
+            blocked = status_counts["blocked"][member]
+            
+            display_name = _display(member)
             
-            result.extend([
-                f"### {display_name}",
-                f"- **Email**: {member}",
-                f"- **Total Tasks**: {load['total']}",
-                f"- **High Priority**: {load['high']}",
-                f"- **Blocked**: {load['blocked']}",
-                f"- **In Progress**: {load['in_progress']}",
-                f"- **Completed**: {load['completed']}",
-                f"- **Todo**: {load['todo']}",
-                ""
-            ])
+            result.write(
+                f"### {display_name}\n"
+                f"- **Email**: {member}\n"
+                f"- **Total Tasks**: {total}\n"
+                f"- **High Priority**: {high}\n"
+                f"- **Blocked**: {blocked}\n"
+                f"- **In Progress**: {status_counts['in_progress'][member]}\n"
+                f"- **Completed**: {status_counts['completed'][member]}\n"
+                f"- **Todo**: {status_counts['todo'][member]}\n"
+                f"\n"
+            )
             
             # Add workload assessment
-            if load['total'] > 10:
-                result.append(f"  ⚠️  **High workload** - Consider redistributing tasks")
-            elif load['blocked'] > 2:
-                result.append(f"  🚧 **Multiple blockers** - Needs support unblocking tasks")
-            elif load['high'] > 3:
-                result.append(f"  🔥 **Many high-priority tasks** - May need prioritization help")
+            if total > 10:
+                result.write("  ⚠️  **High workload** - Consider redistributing tasks\n")
+            elif blocked > 2:
+                result.write("  🚧 **Multiple blockers** - Needs support unblocking tasks\n")
+            elif high > 3:
+                result.write("  🔥 **Many high-priority tasks** - May need prioritization help\n")
                 
-            result.append("")
+            result.write("\n")
         
-        return "\\n".join(result)
+        return result.getvalue()
         
     except Exception as e:
         return f"Error analyzing workload: {str(e)}"
 
 
+@_cache_tool_output
 def search_tasks(query: str, project_name: str = None) -> str:
     """Search for tasks matching a query.
     
@@ -506,61 +1054,73 @@ def search_tasks(query: str, project_name: str = None) -> str:
         Formatted search results
     """
     try:
-        # Switch to the project first if specified
-        if project_name:
-            switch_result = switch_project(project_name)
-            if "Error" in switch_result:
-                return f"Project switch failed: {switch_result}"
-        
-        # Search tasks using the MCP server
+        # Search tasks using the MCP server with project_name parameter
         params = {
             "query": query,
             "limit": 25,
             "offset": 0,
             "include_full_data": False
         }
+        
+        if project_name:
+            params["project_name"] = project_name
             
         search_data = call_mcp_tool("simpletask_search_tasks", params)
         
         if "error" in search_data:
             return f"Error searching tasks: {search_data['error']}"
         
-        items = search_data.get("items", [])
-        total = search_data.get("total_count", 0)
+        search_results = search_data.get("_parsed", {})
+        items = [_Task(task) for task in search_results.get("items", [])]
+        total = search_results.get("total_count", 0)
         
         if not items:
             return f"No tasks found matching '{query}'"
         
-        result = [
-            f"# Search Results for '{query}'",
-            f"**Found**: {total} tasks",
-            f"**Showing**: {len(items)} results",
-            f"**Data Source**: aitistra.com API",
-            ""
-        ]
+        result = io.StringIO()
+        result.write(
+            f"# Search Results for '{query}'\n"
+            f"**Found**: {total} tasks\n"
+            f"**Showing**: {len(items)} results\n"
+            f"**Data Source**: aitistra.com API\n"
+            f"\n"
+        )
         
         for i, task in enumerate(items, 1):
-            title = task.get("title", "Untitled")
-            status = task.get("status", "unknown").title()
-            priority = task.get("priority", "unknown").title()
-            assigned = task.get("assigned_to") or "Unassigned"
-            task_id = task.get("id", "unknown")
+            title = task.title
+            status = _status_label(task.status)
+            priority = _priority_label(task.priority)
+            assigned = task.assigned_to or "Unassigned"
+            task_id = task.id
             
-            result.extend([
-                f"## {i}. {title}",
-                f"- **Status**: {status}",
-                f"- **Priority**: {priority}",
-                f"- **Assigned**: {assigned}",
-                f"- **ID**: {task_id}",
-                ""
-            ])
+            result.write(
+                f"## {i}. {title}\n"
+                f"- **Status**: {status}\n"
+                f"- **Priority**: {priority}\n"
+                f"- **Assigned**: {assigned}\n"
+                f"- **ID**: {task_id}\n"
+                f"\n"
+            )
         
-        return "\\n".join(result)
+        return result.getvalue()
         
     except Exception as e:
         return f"Error searching tasks: {str(e)}"
 
 
+# simpletask_list_projects returns a markdown summary followed by the project
+# definitions as JSON under this heading
+_PROJECT_DATA_HEADING = "## Full Project Data:"
+
+
+def _project_list(projects_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Extract the project definitions from a simpletask_list_projects response."""
+    content = projects_data.get("content") or [{}]
+    _, heading, project_json = content[0].get("text", "").partition(_PROJECT_DATA_HEADING)
+    return _loads(project_json) if heading else []
+
+
+@_cache_tool_output
 def get_project_info(project_name: str = None) -> str:
     """Get information about the current project.
     
@@ -571,33 +1131,29 @@ def get_project_info(project_name: str = None) -> str:
         Formatted project information
     """
     try:
-        # Switch to the project first if specified
-        if project_name:
-            switch_result = switch_project(project_name)
-            if "Error" in switch_result:
-                return f"Project switch failed: {switch_result}"
-        
-        # Get project info using the MCP server
-        project_data = call_mcp_tool("simpletask_get_project_info", {})
+        # Get project info and the list of all projects concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            project_future = executor.submit(
+                call_mcp_tool,
+                "simpletask_get_project_info",
+                {"project_name": project_name} if project_name else {}
+            )
+            projects_future = executor.submit(call_mcp_tool, "simpletask_list_projects", {})
+            project_data, projects_data = project_future.result(), projects_future.result()
         
         if "error" in project_data:
             return f"Error getting project info: {project_data['error']}"
         
-        # Also get list of all projects
-        projects_data = call_mcp_tool("simpletask_list_projects", {})
-        
-        result = [
-            f"# Project Information",
-            f"**Data Source**: aitistra.com API",
-            ""
-        ]
+        result = io.StringIO()
+        result.write(
+            "# Project Information\n"
+            "**Data Source**: aitistra.com API\n"
+            "\n"
+        )
         
         if not "error" in projects_data:
-            projects = projects_data
-            result.extend([
-                f"## Available Projects ({len(projects)} total):",
-                ""
-            ])
+            projects = _project_list(projects_data)
+            result.write(f"## Available Projects ({len(projects)} total):\n\n")
             
             for project in projects:
                 name = project.get("name", "Unknown")
@@ -605,14 +1161,14 @@ def get_project_info(project_name: str = None) -> str:
                 description = project.get("description", "No description")
                 is_current = project_name == project_name_key if project_name else False
                 
-                result.extend([
-                    f"### {name} {'**[CURRENT]**' if is_current else ''}",
-                    f"- **Project Key**: {project_name_key}",
-                    f"- **Description**: {description}",
-                    ""
-                ])
-        
-        return "\\n".join(result)
+                result.write(
+                    f"### {name} {'**[CURRENT]**' if is_current else ''}\n"
+                    f"- **Project Key**: {project_name_key}\n"
+                    f"- **Description**: {description}\n"
+                    f"\n"
+                )
+        
+        return result.getvalue()
         
     except Exception as e:
         return f"Error getting project info: {str(e)}"
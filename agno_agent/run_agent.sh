@@ -15,4 +15,4 @@ fi
 
 # Activate virtual environment and run agent
 source venv/bin/activate
-python real_agent.py
+python real_agent.py "$@"